@@ -0,0 +1,33 @@
+import time
+from collections.abc import Callable, Hashable
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class TTLCache(Generic[T]):
+    """Bounded cache whose entries expire `ttl_seconds` after they were fetched.
+
+    Once `maxsize` is reached, the least recently used entry is evicted.
+    Meant to be created per instance, so cached values never outlive (or leak
+    between) the objects that fetched them.
+    """
+
+    def __init__(self, *, ttl_seconds: float, maxsize: int):
+        self.ttl_seconds = ttl_seconds
+        self.maxsize = maxsize
+        self._entries: dict[Hashable, tuple[float, T]] = {}
+
+    def get_or_fetch(self, key: Hashable, fetch: Callable[[], T]) -> T:
+        entry = self._entries.get(key)
+        if entry is not None and time.monotonic() - entry[0] < self.ttl_seconds:
+            # Moving the entry to the end keeps the dict in least to most
+            # recently used order without resetting its fetch time
+            self._entries[key] = self._entries.pop(key)
+            return entry[1]
+        value = fetch()
+        self._entries.pop(key, None)
+        self._entries[key] = (time.monotonic(), value)
+        while len(self._entries) > self.maxsize:
+            del self._entries[next(iter(self._entries))]
+        return value
@@ -5,15 +5,15 @@ from mcp.server.fastmcp import FastMCP
 from dbt_mcp.config.config import Config
 from dbt_mcp.prompts.prompts import get_prompt
 
+# Commands that should always be quiet to reduce output verbosity
+VERBOSE_COMMANDS = frozenset({"build", "compile", "docs", "parse", "run", "test"})
+
 
 def register_dbt_cli_tools(dbt_mcp: FastMCP, config: Config) -> None:
     def _run_dbt_command(command: list[str]) -> str:
-        # Commands that should always be quiet to reduce output verbosity
-        verbose_commands = ["build", "compile", "docs", "parse", "run", "test"]
-
         full_command = command.copy()
         # Add --quiet flag to specific commands to reduce context window usage
-        if len(full_command) > 0 and full_command[0] in verbose_commands:
+        if len(full_command) > 0 and full_command[0] in VERBOSE_COMMANDS:
             main_command = full_command[0]
             command_args = full_command[1:] if len(full_command) > 1 else []
             full_command = [main_command, "--quiet", *command_args]
@@ -3,10 +3,12 @@ from typing import Literal, TypedDict
 
 import requests
 
+from dbt_mcp.cache.ttl_cache import TTLCache
 from dbt_mcp.gql.errors import raise_gql_error
 
 PAGE_SIZE = 100
 MAX_NUM_MODELS = 1000
+MODELS_CACHE_TTL_SECONDS = 300
 
 
 class GraphQLQueries:
@@ -22,6 +24,7 @@ class GraphQLQueries:
                 applied {
                     models(filter: $modelsFilter, after: $after, first: $first, sort: $sort) {
                         pageInfo {
+                            hasNextPage
                             endCursor
                         }
                         edges {
@@ -136,9 +139,6 @@ class GraphQLQueries:
             environment(id: $environmentId) {
                 applied {
                     models(filter: $modelsFilter, first: $first) {
-                        pageInfo {
-                            endCursor
-                        }
                         edges {
                             node {
                                 parents 
@@ -165,9 +165,6 @@ class GraphQLQueries:
             environment(id: $environmentId) {
                 applied {
                     models(filter: $modelsFilter, first: $first) {
-                        pageInfo {
-                            endCursor
-                        }
                         edges {
                             node {
                                 children 
@@ -197,12 +194,14 @@ class MetadataAPIClient:
             "Authorization": f"Bearer {token}",
             "Content-Type": "application/json",
         }
+        # Reusing a session keeps the connection alive across paginated requests
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
 
     def execute_query(self, query: str, variables: dict) -> dict:
-        response = requests.post(
+        response = self.session.post(
             url=self.url,
             json={"query": query, "variables": variables},
-            headers=self.headers,
         )
         return response.json()
 
@@ -211,29 +210,44 @@ class ModelFilter(TypedDict, total=False):
     modelingLayer: Literal["marts"] | None
 
 
+ModelNodeQueryKind = Literal["details", "parents", "children"]
+
+MODEL_NODE_QUERIES: dict[ModelNodeQueryKind, str] = {
+    "details": GraphQLQueries.GET_MODEL_DETAILS,
+    "parents": GraphQLQueries.GET_MODEL_PARENTS,
+    "children": GraphQLQueries.GET_MODEL_CHILDREN,
+}
+
+
 class ModelsFetcher:
     def __init__(self, api_client: MetadataAPIClient, environment_id: int):
         self.api_client = api_client
         self.environment_id = environment_id
+        self._models_cache: TTLCache[list[dict]] = TTLCache(
+            ttl_seconds=MODELS_CACHE_TTL_SECONDS, maxsize=8
+        )
+        self._model_node_cache: TTLCache[dict | None] = TTLCache(
+            ttl_seconds=MODELS_CACHE_TTL_SECONDS, maxsize=256
+        )
 
     def _parse_response_to_json(self, result: dict) -> list[dict]:
         raise_gql_error(result)
         edges = result["data"]["environment"]["applied"]["models"]["edges"]
-        parsed_edges: list[dict] = []
-        if not edges:
-            return parsed_edges
-        if result.get("errors"):
-            raise Exception(f"GraphQL query failed: {result['errors']}")
-        for edge in edges:
-            if not isinstance(edge, dict) or "node" not in edge:
-                continue
-            node = edge["node"]
-            if not isinstance(node, dict):
-                continue
-            parsed_edges.append(node)
-        return parsed_edges
+        return [
+            edge["node"]
+            for edge in edges or []
+            if isinstance(edge, dict) and isinstance(edge.get("node"), dict)
+        ]
 
     def fetch_models(self, model_filter: ModelFilter | None = None) -> list[dict]:
+        # Models only change when a job runs in the environment, so tool calls
+        # within the same TTL window reuse the previously fetched pages.
+        return self._models_cache.get_or_fetch(
+            key=tuple(sorted((model_filter or {}).items())),
+            fetch=lambda: self._fetch_models(model_filter),
+        )
+
+    def _fetch_models(self, model_filter: ModelFilter | None) -> list[dict]:
         has_next_page = True
         after_cursor: str = ""
         all_edges: list[dict] = []
@@ -249,56 +263,41 @@ class ModelsFetcher:
             result = self.api_client.execute_query(GraphQLQueries.GET_MODELS, variables)
             all_edges.extend(self._parse_response_to_json(result))
 
-            previous_after_cursor = after_cursor
-            after_cursor = result["data"]["environment"]["applied"]["models"][
-                "pageInfo"
-            ]["endCursor"]
-            if previous_after_cursor == after_cursor:
-                has_next_page = False
+            page_info = result["data"]["environment"]["applied"]["models"]["pageInfo"]
+            has_next_page = page_info["hasNextPage"]
+            after_cursor = page_info["endCursor"]
 
         return all_edges
 
-    def fetch_model_details(self, model_name: str) -> dict:
+    def _fetch_model_node(
+        self, kind: ModelNodeQueryKind, model_name: str
+    ) -> dict | None:
+        return self._model_node_cache.get_or_fetch(
+            key=(kind, model_name),
+            fetch=lambda: self._query_model_node(MODEL_NODE_QUERIES[kind], model_name),
+        )
+
+    def _query_model_node(self, query: str, model_name: str) -> dict | None:
         variables = {
             "environmentId": self.environment_id,
             "modelsFilter": {"identifier": model_name},
             "first": 1,
         }
-        result = self.api_client.execute_query(
-            GraphQLQueries.GET_MODEL_DETAILS, variables
-        )
+        result = self.api_client.execute_query(query, variables)
         raise_gql_error(result)
         edges = result["data"]["environment"]["applied"]["models"]["edges"]
         if not edges:
-            return {}
+            return None
         return edges[0]["node"]
 
+    def fetch_model_details(self, model_name: str) -> dict:
+        node = self._fetch_model_node("details", model_name)
+        return node or {}
+
     def fetch_model_parents(self, model_name: str) -> list[dict]:
-        variables = {
-            "environmentId": self.environment_id,
-            "modelsFilter": {"identifier": model_name},
-            "first": 1,
-        }
-        result = self.api_client.execute_query(
-            GraphQLQueries.GET_MODEL_PARENTS, variables
-        )
-        raise_gql_error(result)
-        edges = result["data"]["environment"]["applied"]["models"]["edges"]
-        if not edges:
-            return []
-        return edges[0]["node"]["parents"]
+        node = self._fetch_model_node("parents", model_name)
+        return node["parents"] if node else []
 
     def fetch_model_children(self, model_name: str) -> list[dict]:
-        variables = {
-            "environmentId": self.environment_id,
-            "modelsFilter": {"identifier": model_name},
-            "first": 1,
-        }
-        result = self.api_client.execute_query(
-            GraphQLQueries.GET_MODEL_CHILDREN, variables
-        )
-        raise_gql_error(result)
-        edges = result["data"]["environment"]["applied"]["models"]["edges"]
-        if not edges:
-            return []
-        return edges[0]["node"]["children"]
+        node = self._fetch_model_node("children", model_name)
+        return node["children"] if node else []
@@ -6,10 +6,6 @@ from contextlib import asynccontextmanager
 from mcp.server.fastmcp import FastMCP
 
 from dbt_mcp.config.config import load_config
-from dbt_mcp.dbt_cli.tools import register_dbt_cli_tools
-from dbt_mcp.discovery.tools import register_discovery_tools
-from dbt_mcp.remote.tools import register_remote_tools
-from dbt_mcp.semantic_layer.tools import register_sl_tools
 
 config = load_config()
 logger = logging.getLogger(__name__)
@@ -25,18 +21,32 @@ async def app_lifespan(server: FastMCP) -> AsyncIterator[None]:
         raise e
     finally:
         logger.info("Shutting down MCP server")
+        if config.remote_enabled:
+            from dbt_mcp.remote.tools import close_remote_client
+
+            await close_remote_client()
 
 
 dbt_mcp = FastMCP("dbt", lifespan=app_lifespan)
 
+# Tool modules are imported only when enabled so that disabled toolsets,
+# like the semantic layer SDK and its Arrow dependencies, don't slow startup.
 if config.semantic_layer_enabled:
+    from dbt_mcp.semantic_layer.tools import register_sl_tools
+
     register_sl_tools(dbt_mcp, config)
 
 if config.discovery_enabled:
+    from dbt_mcp.discovery.tools import register_discovery_tools
+
     register_discovery_tools(dbt_mcp, config)
 
 if config.dbt_cli_enabled:
+    from dbt_mcp.dbt_cli.tools import register_dbt_cli_tools
+
     register_dbt_cli_tools(dbt_mcp, config)
 
 if config.remote_enabled:
+    from dbt_mcp.remote.tools import register_remote_tools
+
     asyncio.run(register_remote_tools(dbt_mcp, config))
@@ -4,7 +4,7 @@ from typing import (
     Any,
 )
 
-from httpx import Client
+from httpx import AsyncClient, Client
 from mcp import CallToolRequest, JSONRPCResponse, ListToolsResult
 from mcp.server.fastmcp import FastMCP
 from mcp.server.fastmcp.tools.base import Tool
@@ -29,6 +29,25 @@ from dbt_mcp.config.config import Config
 
 logger = logging.getLogger(__name__)
 
+_client: AsyncClient | None = None
+
+
+def _get_client(config: Config, headers: dict[str, str]) -> AsyncClient:
+    # Created on first use so the client belongs to the server's event loop
+    # rather than the short-lived one the tools are registered in. It is shared
+    # by every remote tool so calls reuse pooled connections.
+    global _client
+    if _client is None:
+        _client = AsyncClient(base_url=config.remote_mcp_base_url, headers=headers)
+    return _client
+
+
+async def close_remote_client() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
 
 # Based on this: https://github.com/modelcontextprotocol/python-sdk/blob/9ae4df85fbab97bf476ddd160b766ca4c208cd13/src/mcp/server/fastmcp/utilities/func_metadata.py#L105
 def get_remote_tool_fn_metadata(tool: RemoteTool) -> FuncMetadata:
@@ -83,54 +102,50 @@ async def register_remote_tools(dbt_mcp: FastMCP, config: Config) -> None:
             async def tool_function(
                 *args, **kwargs
             ) -> list[TextContent | ImageContent | EmbeddedResource]:
-                with Client(
-                    base_url=config.remote_mcp_base_url, headers=headers
-                ) as client:
-                    tool_call_http_response = client.post(
-                        "/tools/call",
-                        json=CallToolRequest(
-                            method="tools/call",
-                            params=CallToolRequestParams(
-                                name=tool_name,
-                                arguments=kwargs,
-                            ),
-                        ).model_dump(),
+                client = _get_client(config=config, headers=headers)
+                tool_call_http_response = await client.post(
+                    "/tools/call",
+                    json=CallToolRequest(
+                        method="tools/call",
+                        params=CallToolRequestParams(
+                            name=tool_name,
+                            arguments=kwargs,
+                        ),
+                    ).model_dump(),
+                )
+                if tool_call_http_response.status_code != 200:
+                    return [
+                        TextContent(
+                            type="text",
+                            text=f"Failed to call tool {tool_name} with "
+                            + f"status code: {tool_call_http_response.status_code} "
+                            + f"error message: {tool_call_http_response.text}",
+                        )
+                    ]
+                try:
+                    tool_call_jsonrpc_response = JSONRPCResponse.model_validate_json(
+                        tool_call_http_response.text
+                    )
+                    tool_call_result = CallToolResult.model_validate(
+                        tool_call_jsonrpc_response.result
                     )
-                    if tool_call_http_response.status_code != 200:
-                        return [
-                            TextContent(
-                                type="text",
-                                text=f"Failed to call tool {tool_name} with "
-                                + f"status code: {tool_call_http_response.status_code} "
-                                + f"error message: {tool_call_http_response.text}",
-                            )
-                        ]
-                    try:
-                        tool_call_jsonrpc_response = (
-                            JSONRPCResponse.model_validate_json(
-                                tool_call_http_response.text
-                            )
+                except ValidationError as e:
+                    return [
+                        TextContent(
+                            type="text",
+                            text=f"Failed to parse tool response for {tool_name}: "
+                            + f"{e}",
                         )
-                        tool_call_result = CallToolResult.model_validate(
-                            tool_call_jsonrpc_response.result
+                    ]
+                if tool_call_result.isError:
+                    return [
+                        TextContent(
+                            type="text",
+                            text=f"Tool {tool_name} reported an error: "
+                            + f"{tool_call_result.content}",
                         )
-                    except ValidationError as e:
-                        return [
-                            TextContent(
-                                type="text",
-                                text=f"Failed to parse tool response for {tool_name}: "
-                                + f"{e}",
-                            )
-                        ]
-                    if tool_call_result.isError:
-                        return [
-                            TextContent(
-                                type="text",
-                                text=f"Tool {tool_name} reported an error: "
-                                + f"{tool_call_result.content}",
-                            )
-                        ]
-                    return tool_call_result.content
+                    ]
+                return tool_call_result.content
 
             return tool_function
 
@@ -1,9 +1,8 @@
-from functools import cache
-
 from dbtsl.api.shared.query_params import GroupByParam, OrderByGroupBy
 from dbtsl.client.sync import SyncSemanticLayerClient
 from dbtsl.error import QueryFailedError
 
+from dbt_mcp.cache.ttl_cache import TTLCache
 from dbt_mcp.config.config import Config
 from dbt_mcp.semantic_layer.gql.gql import GRAPHQL_QUERIES
 from dbt_mcp.semantic_layer.gql.gql_request import ConnAttr, submit_request
@@ -18,23 +17,37 @@ from dbt_mcp.semantic_layer.types import (
     QueryMetricsSuccess,
 )
 
+SEMANTIC_LAYER_CACHE_TTL_SECONDS = 300
+
 
 class SemanticLayerFetcher:
     def __init__(self, sl_client: SyncSemanticLayerClient, host: str, config: Config):
         self.sl_client = sl_client
         self.host = host
         self.config = config
-        self.entities_cache: dict[str, list[EntityToolResponse]] = {}
-        self.dimensions_cache: dict[str, list[DimensionToolResponse]] = {}
+        self.conn_attr = ConnAttr(
+            host=host,
+            params={"environmentid": config.prod_environment_id},
+            auth_header=f"Bearer {config.token}",
+        )
+        self._metrics_cache: TTLCache[list[MetricToolResponse]] = TTLCache(
+            ttl_seconds=SEMANTIC_LAYER_CACHE_TTL_SECONDS, maxsize=1
+        )
+        self._dimensions_cache: TTLCache[list[DimensionToolResponse]] = TTLCache(
+            ttl_seconds=SEMANTIC_LAYER_CACHE_TTL_SECONDS, maxsize=256
+        )
+        self._entities_cache: TTLCache[list[EntityToolResponse]] = TTLCache(
+            ttl_seconds=SEMANTIC_LAYER_CACHE_TTL_SECONDS, maxsize=256
+        )
 
-    @cache
     def list_metrics(self) -> list[MetricToolResponse]:
+        # Definitions only change when the semantic layer is redeployed,
+        # so lookups are cached for a bounded amount of time
+        return self._metrics_cache.get_or_fetch(key=None, fetch=self._list_metrics)
+
+    def _list_metrics(self) -> list[MetricToolResponse]:
         metrics_result = submit_request(
-            ConnAttr(
-                host=self.host,
-                params={"environmentid": self.config.prod_environment_id},
-                auth_header=f"Bearer {self.config.token}",
-            ),
+            self.conn_attr,
             {"query": GRAPHQL_QUERIES["metrics"]},
         )
         return [
@@ -48,58 +61,53 @@ class SemanticLayerFetcher:
         ]
 
     def get_dimensions(self, metrics: list[str]) -> list[DimensionToolResponse]:
-        metrics_key = ",".join(sorted(metrics))
-        if metrics_key not in self.dimensions_cache:
-            dimensions_result = submit_request(
-                ConnAttr(
-                    host=self.host,
-                    params={"environmentid": self.config.prod_environment_id},
-                    auth_header=f"Bearer {self.config.token}",
-                ),
-                {
-                    "query": GRAPHQL_QUERIES["dimensions"],
-                    "variables": {"metrics": [{"name": m} for m in metrics]},
-                },
+        metrics_key = tuple(sorted(metrics))
+        return self._dimensions_cache.get_or_fetch(
+            key=metrics_key, fetch=lambda: self._get_dimensions(metrics_key)
+        )
+
+    def _get_dimensions(self, metrics: tuple[str, ...]) -> list[DimensionToolResponse]:
+        dimensions_result = submit_request(
+            self.conn_attr,
+            {
+                "query": GRAPHQL_QUERIES["dimensions"],
+                "variables": {"metrics": [{"name": m} for m in metrics]},
+            },
+        )
+        return [
+            DimensionToolResponse(
+                name=d.get("name"),
+                type=d.get("type"),
+                description=d.get("description"),
+                label=d.get("label"),
+                granularities=d.get("queryableGranularities")
+                + d.get("queryableTimeGranularities"),
             )
-            dimensions = []
-            for d in dimensions_result["data"]["dimensions"]:
-                dimensions.append(
-                    DimensionToolResponse(
-                        name=d.get("name"),
-                        type=d.get("type"),
-                        description=d.get("description"),
-                        label=d.get("label"),
-                        granularities=d.get("queryableGranularities")
-                        + d.get("queryableTimeGranularities"),
-                    )
-                )
-            self.dimensions_cache[metrics_key] = dimensions
-        return self.dimensions_cache[metrics_key]
+            for d in dimensions_result["data"]["dimensions"]
+        ]
 
     def get_entities(self, metrics: list[str]) -> list[EntityToolResponse]:
-        metrics_key = ",".join(sorted(metrics))
-        if metrics_key not in self.entities_cache:
-            entities_result = submit_request(
-                ConnAttr(
-                    host=self.host,
-                    params={"environmentid": self.config.prod_environment_id},
-                    auth_header=f"Bearer {self.config.token}",
-                ),
-                {
-                    "query": GRAPHQL_QUERIES["entities"],
-                    "variables": {"metrics": [{"name": m} for m in metrics]},
-                },
+        metrics_key = tuple(sorted(metrics))
+        return self._entities_cache.get_or_fetch(
+            key=metrics_key, fetch=lambda: self._get_entities(metrics_key)
+        )
+
+    def _get_entities(self, metrics: tuple[str, ...]) -> list[EntityToolResponse]:
+        entities_result = submit_request(
+            self.conn_attr,
+            {
+                "query": GRAPHQL_QUERIES["entities"],
+                "variables": {"metrics": [{"name": m} for m in metrics]},
+            },
+        )
+        return [
+            EntityToolResponse(
+                name=e.get("name"),
+                type=e.get("type"),
+                description=e.get("description"),
             )
-            entities = [
-                EntityToolResponse(
-                    name=e.get("name"),
-                    type=e.get("type"),
-                    description=e.get("description"),
-                )
-                for e in entities_result["data"]["entities"]
-            ]
-            self.entities_cache[metrics_key] = entities
-        return self.entities_cache[metrics_key]
+            for e in entities_result["data"]["entities"]
+        ]
 
     def validate_query_metrics_params(
         self, metrics: list[str], group_by: list[GroupByParam] | None
@@ -114,30 +122,34 @@ class SemanticLayerFetcher:
         for metric_misspelling in metric_misspellings:
             recommendations = (
                 " Did you mean: " + ", ".join(metric_misspelling.similar_words) + "?"
+                if metric_misspelling.similar_words
+                else ""
             )
             errors.append(
                 f"Metric {metric_misspelling.word} not found." + recommendations
-                if metric_misspelling.similar_words
-                else ""
             )
 
         if errors:
             return f"Errors: {', '.join(errors)}"
 
+        # Skip fetching dimensions when there is nothing to validate
+        if not group_by:
+            return None
+
         available_dimensions = [d.name for d in self.get_dimensions(metrics)]
         dimension_misspellings = get_misspellings(
-            targets=[g.name for g in group_by or []],
+            targets=[g.name for g in group_by],
             words=available_dimensions,
             top_k=5,
         )
         for dimension_misspelling in dimension_misspellings:
             recommendations = (
                 " Did you mean: " + ", ".join(dimension_misspelling.similar_words) + "?"
+                if dimension_misspelling.similar_words
+                else ""
             )
             errors.append(
                 f"Dimension {dimension_misspelling.word} not found." + recommendations
-                if dimension_misspelling.similar_words
-                else ""
             )
 
         if errors:
@@ -208,7 +220,7 @@ class SemanticLayerFetcher:
                     query_error = e
             if query_error:
                 return self._format_query_failed_error(query_error)
-            json_result = query_result.to_pandas().to_json(orient="records", indent=2)
+            json_result = query_result.to_pandas().to_json(orient="records")
             return QueryMetricsSuccess(result=json_result)
         except Exception as e:
             return self._format_query_failed_error(e)
@@ -4,6 +4,9 @@ import requests
 
 from dbt_mcp.gql.errors import raise_gql_error
 
+# Shared across requests so the connection to the Semantic Layer is reused
+_session = requests.Session()
+
 
 @dataclass
 class ConnAttr:
@@ -20,7 +23,7 @@ def submit_request(
     if "variables" not in payload:
         payload["variables"] = {}
     payload["variables"]["environmentId"] = conn_attr.params["environmentid"]
-    r = requests.post(
+    r = _session.post(
         url,
         json=payload,
         headers={
@@ -7,24 +7,27 @@ class Misspelling:
     similar_words: list[str]
 
 
-def levenshtein(s1: str, s2: str) -> int:
-    len_s1, len_s2 = len(s1), len(s2)
-    dp = [[0] * (len_s2 + 1) for _ in range(len_s1 + 1)]
+def levenshtein(s1: str, s2: str, max_distance: int | None = None) -> int:
+    # Distance is symmetric, so keep the rows as short as possible
+    if len(s1) < len(s2):
+        s1, s2 = s2, s1
 
-    for i in range(len_s1 + 1):
-        dp[i][0] = i
-    for j in range(len_s2 + 1):
-        dp[0][j] = j
-
-    for i in range(1, len_s1 + 1):
-        for j in range(1, len_s2 + 1):
-            cost = 0 if s1[i - 1] == s2[j - 1] else 1
-            dp[i][j] = min(
-                dp[i - 1][j] + 1,  # Deletion
-                dp[i][j - 1] + 1,  # Insertion
-                dp[i - 1][j - 1] + cost,  # Substitution
+    previous_row = list(range(len(s2) + 1))
+    for i, c1 in enumerate(s1, start=1):
+        current_row = [i]
+        for j, c2 in enumerate(s2, start=1):
+            current_row.append(
+                min(
+                    previous_row[j] + 1,  # Deletion
+                    current_row[j - 1] + 1,  # Insertion
+                    previous_row[j - 1] + (c1 != c2),  # Substitution
+                )
             )
-    return dp[len_s1][len_s2]
+        # The smallest value in a row is a lower bound on the final distance
+        if max_distance is not None and min(current_row) > max_distance:
+            return max_distance + 1
+        previous_row = current_row
+    return previous_row[-1]
 
 
 def get_closest_words(
@@ -33,7 +36,13 @@ def get_closest_words(
     top_k: int | None = None,
     threshold: int | None = None,
 ) -> list[str]:
-    distances = [(word, levenshtein(target, word)) for word in words]
+    # The length difference is a lower bound on the distance, so words that
+    # can't be within the threshold are skipped without computing it
+    distances = [
+        (word, levenshtein(target, word, max_distance=threshold))
+        for word in words
+        if threshold is None or abs(len(word) - len(target)) <= threshold
+    ]
 
     # Filter by threshold if provided
     if threshold is not None:
@@ -55,8 +64,9 @@ def get_misspellings(
     top_k: int | None = None,
 ) -> list[Misspelling]:
     misspellings = []
+    word_set = frozenset(words)
     for target in targets:
-        if target not in words:
+        if target not in word_set:
             misspellings.append(
                 Misspelling(
                     word=target,
@@ -0,0 +1,59 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from dbt_mcp.cache.ttl_cache import TTLCache
+
+
+class TestTTLCache(unittest.TestCase):
+    @patch("dbt_mcp.cache.ttl_cache.time.monotonic")
+    def test_entry_expires_after_ttl(self, mock_monotonic):
+        cache: TTLCache[str] = TTLCache(ttl_seconds=60, maxsize=8)
+        fetch = MagicMock(side_effect=["first", "second"])
+
+        mock_monotonic.return_value = 1000.0
+        cache.get_or_fetch(key="key", fetch=fetch)
+        mock_monotonic.return_value = 1059.0
+        cached = cache.get_or_fetch(key="key", fetch=fetch)
+        mock_monotonic.return_value = 1060.0
+        refetched = cache.get_or_fetch(key="key", fetch=fetch)
+
+        self.assertEqual(cached, "first")
+        self.assertEqual(refetched, "second")
+        self.assertEqual(fetch.call_count, 2)
+
+    def test_evicts_least_recently_used_entry_when_full(self):
+        cache: TTLCache[str] = TTLCache(ttl_seconds=60, maxsize=2)
+        for key in ("a", "b", "c"):
+            cache.get_or_fetch(key=key, fetch=MagicMock(return_value=key))
+
+        fetch = MagicMock(return_value="refetched")
+        self.assertEqual(cache.get_or_fetch(key="b", fetch=fetch), "b")
+        self.assertEqual(cache.get_or_fetch(key="c", fetch=fetch), "c")
+        fetch.assert_not_called()
+        self.assertEqual(cache.get_or_fetch(key="a", fetch=fetch), "refetched")
+
+    def test_cache_hit_keeps_entry_from_eviction(self):
+        cache: TTLCache[str] = TTLCache(ttl_seconds=60, maxsize=2)
+        cache.get_or_fetch(key="a", fetch=MagicMock(return_value="a"))
+        cache.get_or_fetch(key="b", fetch=MagicMock(return_value="b"))
+        cache.get_or_fetch(key="a", fetch=MagicMock(return_value="unused"))
+        cache.get_or_fetch(key="c", fetch=MagicMock(return_value="c"))
+
+        fetch = MagicMock(return_value="refetched")
+        self.assertEqual(cache.get_or_fetch(key="a", fetch=fetch), "a")
+        fetch.assert_not_called()
+        self.assertEqual(cache.get_or_fetch(key="b", fetch=fetch), "refetched")
+
+    def test_failed_fetch_is_not_cached(self):
+        cache: TTLCache[str] = TTLCache(ttl_seconds=60, maxsize=8)
+        fetch = MagicMock(side_effect=[RuntimeError("boom"), "value"])
+
+        with self.assertRaises(RuntimeError):
+            cache.get_or_fetch(key="key", fetch=fetch)
+
+        self.assertEqual(cache.get_or_fetch(key="key", fetch=fetch), "value")
+        self.assertEqual(fetch.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
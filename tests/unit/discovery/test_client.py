@@ -0,0 +1,93 @@
+import unittest
+from unittest.mock import MagicMock
+
+from dbt_mcp.discovery.client import GraphQLQueries, ModelsFetcher
+
+
+def _models_page(names: list[str], end_cursor: str, has_next_page: bool) -> dict:
+    return {
+        "data": {
+            "environment": {
+                "applied": {
+                    "models": {
+                        "pageInfo": {
+                            "hasNextPage": has_next_page,
+                            "endCursor": end_cursor,
+                        },
+                        "edges": [
+                            {"node": {"name": name, "description": None}}
+                            for name in names
+                        ],
+                    }
+                }
+            }
+        }
+    }
+
+
+class TestModelsFetcher(unittest.TestCase):
+    def test_fetch_models_stops_on_last_page(self):
+        api_client = MagicMock()
+        api_client.execute_query.side_effect = [
+            _models_page(["a", "b"], end_cursor="cursor_1", has_next_page=True),
+            _models_page(["c"], end_cursor="cursor_2", has_next_page=False),
+        ]
+        models_fetcher = ModelsFetcher(api_client=api_client, environment_id=1)
+
+        models = models_fetcher.fetch_models()
+
+        self.assertEqual([m["name"] for m in models], ["a", "b", "c"])
+        self.assertEqual(api_client.execute_query.call_count, 2)
+        query, variables = api_client.execute_query.call_args.args
+        self.assertEqual(query, GraphQLQueries.GET_MODELS)
+        self.assertEqual(variables["after"], "cursor_1")
+
+    def test_fetch_models_reuses_cached_result(self):
+        api_client = MagicMock()
+        api_client.execute_query.return_value = _models_page(
+            ["a"], end_cursor="cursor_1", has_next_page=False
+        )
+        models_fetcher = ModelsFetcher(api_client=api_client, environment_id=1)
+
+        models_fetcher.fetch_models(model_filter={"modelingLayer": "marts"})
+        models_fetcher.fetch_models(model_filter={"modelingLayer": "marts"})
+
+        api_client.execute_query.assert_called_once()
+
+    def test_fetch_models_treats_missing_filter_as_empty(self):
+        api_client = MagicMock()
+        api_client.execute_query.return_value = _models_page(
+            ["a"], end_cursor="cursor_1", has_next_page=False
+        )
+        models_fetcher = ModelsFetcher(api_client=api_client, environment_id=1)
+
+        models_fetcher.fetch_models(model_filter=None)
+        models_fetcher.fetch_models(model_filter={})
+
+        api_client.execute_query.assert_called_once()
+
+    def test_fetch_model_parents_reuses_cached_result(self):
+        api_client = MagicMock()
+        api_client.execute_query.return_value = {
+            "data": {
+                "environment": {
+                    "applied": {
+                        "models": {
+                            "edges": [{"node": {"parents": [{"name": "stg_orders"}]}}]
+                        }
+                    }
+                }
+            }
+        }
+        models_fetcher = ModelsFetcher(api_client=api_client, environment_id=1)
+
+        self.assertEqual(
+            models_fetcher.fetch_model_parents("orders"), [{"name": "stg_orders"}]
+        )
+        models_fetcher.fetch_model_parents("orders")
+
+        api_client.execute_query.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
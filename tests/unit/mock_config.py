@@ -0,0 +1,19 @@
+from dbt_mcp.config.config import Config
+
+
+def make_config() -> Config:
+    return Config(
+        host="localhost",
+        prod_environment_id=1,
+        dev_environment_id=1,
+        user_id=1,
+        token="token",
+        project_dir="/test/project",
+        dbt_cli_enabled=True,
+        semantic_layer_enabled=True,
+        discovery_enabled=True,
+        remote_enabled=True,
+        dbt_command="dbt",
+        multicell_account_prefix=None,
+        remote_mcp_base_url="http://localhost/mcp",
+    )
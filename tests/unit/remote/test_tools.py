@@ -0,0 +1,76 @@
+import unittest
+from unittest.mock import patch
+
+import httpx
+from mcp.server.fastmcp import FastMCP
+from mcp.types import Tool as RemoteTool
+
+from dbt_mcp.remote import tools as remote_tools
+from dbt_mcp.remote.tools import close_remote_client, register_remote_tools
+from tests.unit.mock_config import make_config
+
+
+def _tool_call_response(text: str, is_error: bool) -> dict:
+    return {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "result": {"content": [{"type": "text", "text": text}], "isError": is_error},
+    }
+
+
+class TestRemoteTools(unittest.IsolatedAsyncioTestCase):
+    async def asyncTearDown(self):
+        await close_remote_client()
+
+    async def _call_echo_tool(self, response: httpx.Response) -> str:
+        remote_tools._client = httpx.AsyncClient(
+            base_url="http://localhost/mcp",
+            transport=httpx.MockTransport(lambda request: response),
+        )
+        dbt_mcp = FastMCP("Test")
+        echo_tool = RemoteTool(
+            name="echo_tool",
+            description="Echoes the message",
+            inputSchema={"type": "object", "properties": {"message": {}}},
+        )
+        with patch("dbt_mcp.remote.tools._get_remote_tools", return_value=[echo_tool]):
+            await register_remote_tools(dbt_mcp, make_config())
+
+        result = await dbt_mcp.call_tool("echo_tool", {"message": "Hello"})
+
+        self.assertEqual(len(result), 1)
+        return result[0].text
+
+    async def test_tool_returns_remote_content(self):
+        text = await self._call_echo_tool(
+            httpx.Response(200, json=_tool_call_response("Hello", is_error=False))
+        )
+
+        self.assertEqual(text, "Hello")
+
+    async def test_tool_reports_non_200_status(self):
+        text = await self._call_echo_tool(httpx.Response(500, text="boom"))
+
+        self.assertEqual(
+            text,
+            "Failed to call tool echo_tool with status code: 500 error message: boom",
+        )
+
+    async def test_tool_reports_unparseable_response(self):
+        text = await self._call_echo_tool(httpx.Response(200, text="not json"))
+
+        self.assertTrue(
+            text.startswith("Failed to parse tool response for echo_tool: ")
+        )
+
+    async def test_tool_reports_remote_error(self):
+        text = await self._call_echo_tool(
+            httpx.Response(200, json=_tool_call_response("boom", is_error=True))
+        )
+
+        self.assertTrue(text.startswith("Tool echo_tool reported an error: "))
+        self.assertIn("boom", text)
+
+
+if __name__ == "__main__":
+    unittest.main()
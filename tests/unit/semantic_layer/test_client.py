@@ -0,0 +1,143 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from dbtsl.models.metric import MetricType
+
+from dbt_mcp.semantic_layer.client import SemanticLayerFetcher
+from dbt_mcp.semantic_layer.types import MetricToolResponse
+from tests.unit.mock_config import make_config
+
+
+def _metrics_response(names: list[str]) -> dict:
+    return {
+        "data": {
+            "metrics": [
+                {"name": name, "type": "SIMPLE", "label": None, "description": None}
+                for name in names
+            ]
+        }
+    }
+
+
+def _dimensions_response(names: list[str]) -> dict:
+    return {
+        "data": {
+            "dimensions": [
+                {
+                    "name": name,
+                    "type": "CATEGORICAL",
+                    "description": None,
+                    "label": None,
+                    "queryableGranularities": [],
+                    "queryableTimeGranularities": [],
+                }
+                for name in names
+            ]
+        }
+    }
+
+
+def _entities_response(names: list[str]) -> dict:
+    return {
+        "data": {
+            "entities": [
+                {"name": name, "type": "PRIMARY", "description": None} for name in names
+            ]
+        }
+    }
+
+
+def _semantic_layer_fetcher() -> SemanticLayerFetcher:
+    return SemanticLayerFetcher(
+        sl_client=MagicMock(), host="semantic-layer.localhost", config=make_config()
+    )
+
+
+class TestSemanticLayerFetcher(unittest.TestCase):
+    @patch("dbt_mcp.semantic_layer.client.submit_request")
+    def test_list_metrics_reuses_cached_result(self, mock_submit_request):
+        mock_submit_request.return_value = _metrics_response(["revenue"])
+        fetcher = _semantic_layer_fetcher()
+
+        fetcher.list_metrics()
+        metrics = fetcher.list_metrics()
+
+        self.assertEqual([m.name for m in metrics], ["revenue"])
+        mock_submit_request.assert_called_once()
+
+    @patch("dbt_mcp.semantic_layer.client.submit_request")
+    def test_list_metrics_cache_is_per_fetcher(self, mock_submit_request):
+        mock_submit_request.side_effect = [
+            _metrics_response(["revenue"]),
+            _metrics_response(["orders"]),
+        ]
+        fetcher = _semantic_layer_fetcher()
+        other_fetcher = _semantic_layer_fetcher()
+
+        fetcher.list_metrics()
+        other_fetcher.list_metrics()
+        metrics = fetcher.list_metrics()
+
+        self.assertEqual([m.name for m in metrics], ["revenue"])
+        self.assertEqual(mock_submit_request.call_count, 2)
+
+    @patch("dbt_mcp.semantic_layer.client.submit_request")
+    def test_get_dimensions_reuses_cached_result_for_reordered_metrics(
+        self, mock_submit_request
+    ):
+        mock_submit_request.return_value = _dimensions_response(["customer"])
+        fetcher = _semantic_layer_fetcher()
+
+        fetcher.get_dimensions(metrics=["revenue", "orders"])
+        dimensions = fetcher.get_dimensions(metrics=["orders", "revenue"])
+
+        self.assertEqual([d.name for d in dimensions], ["customer"])
+        mock_submit_request.assert_called_once()
+
+    @patch("dbt_mcp.semantic_layer.client.submit_request")
+    def test_get_entities_reuses_cached_result_for_reordered_metrics(
+        self, mock_submit_request
+    ):
+        mock_submit_request.return_value = _entities_response(["order"])
+        fetcher = _semantic_layer_fetcher()
+
+        fetcher.get_entities(metrics=["revenue", "orders"])
+        entities = fetcher.get_entities(metrics=["orders", "revenue"])
+
+        self.assertEqual([e.name for e in entities], ["order"])
+        mock_submit_request.assert_called_once()
+
+    def test_validate_query_metrics_params_reports_unknown_metric_without_match(
+        self,
+    ):
+        fetcher = _semantic_layer_fetcher()
+
+        with patch.object(
+            fetcher,
+            "list_metrics",
+            return_value=[MetricToolResponse(name="revenue", type=MetricType.SIMPLE)],
+        ):
+            error = fetcher.validate_query_metrics_params(
+                metrics=["zzzzzzzzzz"], group_by=None
+            )
+
+        self.assertEqual(error, "Errors: Metric zzzzzzzzzz not found.")
+
+    def test_validate_query_metrics_params_skips_dimensions_without_group_by(self):
+        fetcher = _semantic_layer_fetcher()
+        metrics = [MetricToolResponse(name="revenue", type=MetricType.SIMPLE)]
+
+        with (
+            patch.object(fetcher, "list_metrics", return_value=metrics),
+            patch.object(fetcher, "get_dimensions") as mock_get_dimensions,
+        ):
+            error = fetcher.validate_query_metrics_params(
+                metrics=["revenue"], group_by=None
+            )
+
+        self.assertIsNone(error)
+        mock_get_dimensions.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
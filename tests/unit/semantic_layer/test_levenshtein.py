@@ -0,0 +1,46 @@
+import unittest
+
+from dbt_mcp.semantic_layer.levenshtein import (
+    get_closest_words,
+    get_misspellings,
+    levenshtein,
+)
+
+
+class TestLevenshtein(unittest.TestCase):
+    def test_levenshtein(self):
+        test_cases = [
+            ("", "", 0),
+            ("revenue", "revenue", 0),
+            ("", "revenue", 7),
+            ("kitten", "sitting", 3),
+            ("sitting", "kitten", 3),
+            ("revenue", "revenues", 1),
+            ("order_total", "orders_total", 1),
+        ]
+        for s1, s2, expected in test_cases:
+            self.assertEqual(levenshtein(s1, s2), expected)
+
+    def test_levenshtein_stops_past_max_distance(self):
+        self.assertEqual(levenshtein("revenue", "customers", max_distance=2), 3)
+        self.assertEqual(levenshtein("revenue", "revenues", max_distance=2), 1)
+
+    def test_get_closest_words(self):
+        words = ["revenue", "revenues", "gross_revenue", "orders", "customers"]
+        self.assertEqual(
+            get_closest_words(target="revenu", words=words, top_k=5, threshold=3),
+            ["revenue", "revenues"],
+        )
+
+    def test_get_misspellings(self):
+        words = ["revenue", "orders", "customers"]
+        misspellings = get_misspellings(
+            targets=["revenue", "order"], words=words, top_k=5
+        )
+        self.assertEqual(len(misspellings), 1)
+        self.assertEqual(misspellings[0].word, "order")
+        self.assertEqual(misspellings[0].similar_words, ["orders"])
+
+
+if __name__ == "__main__":
+    unittest.main()